@@ -2,9 +2,21 @@
 Camera Application GUI and Logic
 """
 
+import logging
 import os
+import queue
+import threading
+
 from PyQt5 import QtCore
-from PyQt5.QtGui import QPalette, QPixmap, QIcon
+from PyQt5.QtGui import (
+    QColor,
+    QPalette,
+    QPixmap,
+    QPixmapCache,
+    QIcon,
+    QImage,
+    QImageReader,
+)
 from PyQt5.QtWidgets import (
     QCheckBox,
     QHBoxLayout,
@@ -16,11 +28,20 @@ from PyQt5.QtWidgets import (
     QGridLayout,
     QSizePolicy,
     QLabel,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QApplication,
 )
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import (
+    Qt,
+    QSize,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from libcamera import controls
 
 from picamera2 import Picamera2
@@ -30,14 +51,46 @@ from camera_config import CameraConfig
 from file_utils import FileManager
 from speech_widget import SpeechRecognitionWidget
 
+logger = logging.getLogger(__name__)
+
+
+def _make_separator(shape):
+    """Build a sunken separator line coloured via the palette.
+
+    A stylesheet here would force the QSS painter onto the widget; the
+    palette keeps Qt's native frame painting path.
+    """
+    separator = QFrame()
+    separator.setFrameShape(shape)
+    separator.setFrameShadow(QFrame.Sunken)
+    palette = separator.palette()
+    palette.setColor(QPalette.WindowText, QColor("#ccc"))
+    separator.setPalette(palette)
+    return separator
+
+
+class CaptureSignal(QObject):
+    """Queues picamera2 job completions into the Qt event loop.
+
+    Stands in for QGlPicamera2.signal_done so captures do not depend on
+    the preview popup existing.
+    """
+
+    done_signal = pyqtSignal(object)
+
+    def signal_done(self, job):
+        self.done_signal.emit(job)
+
 
 class CameraPreviewPopup(QDialog):
     """Popup window for camera preview."""
 
-    def __init__(self, picam2, parent=None):
+    def __init__(self, picam2, parent=None, bg_colour=None):
         super().__init__(parent)
         self.picam2 = picam2
         self.qpicamera2 = None
+        self._bg_colour = bg_colour
+        self._closing_for_real = False
         self._init_ui()
 
     def _init_ui(self):
@@ -50,8 +103,10 @@ class CameraPreviewPopup(QDialog):
         self.setMaximumSize(1200, 900)
 
         # Create camera preview widget - let it use default size first
-        bg_colour = self.palette().color(QPalette.Background).getRgb()[:3]
-        self.qpicamera2 = QGlPicamera2(self.picam2, bg_colour=bg_colour)
+        if self._bg_colour is None:
+            c = self.palette().color(QPalette.Window)
+            self._bg_colour = (c.red(), c.green(), c.blue())
+        self.qpicamera2 = QGlPicamera2(self.picam2, bg_colour=self._bg_colour)
 
         # Set size policy to allow expansion
         self.qpicamera2.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -65,17 +120,73 @@ class CameraPreviewPopup(QDialog):
         self.resize(800, 600)
 
     def closeEvent(self, event):
-        """Handle close event."""
-        self.hide()  # Hide instead of closing to keep the widget alive
+        """Handle close event.
+
+        Hiding instead of closing keeps the QGlPicamera2 widget - and its
+        EGL context, shaders and textures - alive across preview toggles,
+        so re-showing skips the GL setup cost.
+        """
+        if self._closing_for_real:
+            event.accept()
+            return
+        self.hide()
         event.ignore()
 
+    def force_close(self):
+        """Really close the popup (application shutdown)."""
+        self._closing_for_real = True
+        self.close()
+
+
+class ThumbnailSignals(QObject):
+    """Signal holder for ThumbnailJob (QRunnable cannot emit signals itself)."""
+
+    finished = pyqtSignal(int, int, QImage)  # generation, row, image
+
+
+class ThumbnailJob(QRunnable):
+    """Decode and scale one snapshot into a thumbnail off the GUI thread."""
+
+    def __init__(self, path, thumb_path, generation, row, signals):
+        super().__init__()
+        self.path = path
+        self.thumb_path = thumb_path
+        self.generation = generation
+        self.row = row
+        self.signals = signals
+
+    def run(self):
+        """Decode, scale and cache the thumbnail (worker thread)."""
+        # QImage/QImageReader are safe off the GUI thread; QPixmap is not.
+        # setScaledSize routes through libjpeg's scale-on-decode path, so the
+        # full-resolution capture is never decoded just to make a 60x45 icon.
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            size.scale(60, 45, Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+        thumbnail = reader.read()
+        if thumbnail.isNull():
+            logger.error("Failed to load thumbnail for: %s", self.path)
+            return
+        thumbnail.save(self.thumb_path, "PNG")
+        self.signals.finished.emit(self.generation, self.row, thumbnail)
+
 
 class SnapshotListWidget(QWidget):
     """Widget for displaying recent snapshots with copy functionality."""
 
+    # Shared placeholder icon for items whose thumbnail is still being
+    # generated; one pixmap serves every pending item across refreshes
+    _placeholder_icon = None
+
     def __init__(self, file_manager, parent=None):
         super().__init__(parent)
         self.file_manager = file_manager
+        self._refresh_generation = 0
+        self._thumb_signals = ThumbnailSignals()
+        self._thumb_signals.finished.connect(self._on_thumbnail_ready)
         self._init_ui()
         self.refresh_snapshots()
 
@@ -93,6 +204,18 @@ class SnapshotListWidget(QWidget):
         # Set item spacing
         self.snapshot_list.setSpacing(2)
 
+        # All items are the same shape (60x45 icon + one line of text), so
+        # let Qt skip per-item size hints and lay the viewport out in batches
+        self.snapshot_list.setUniformItemSizes(True)
+        self.snapshot_list.setViewMode(QListView.ListMode)
+        self.snapshot_list.setLayoutMode(QListView.Batched)
+        self.snapshot_list.setBatchSize(5)
+
+        if SnapshotListWidget._placeholder_icon is None:
+            placeholder = QPixmap(60, 45)
+            placeholder.fill(Qt.gray)
+            SnapshotListWidget._placeholder_icon = QIcon(placeholder)
+
         layout.addWidget(self.snapshot_list)
 
         self.setLayout(layout)
@@ -113,86 +236,198 @@ class SnapshotListWidget(QWidget):
     def refresh_snapshots(self):
         """Refresh the list of recent snapshots."""
         self.snapshot_list.clear()
+        self._refresh_generation += 1
         recent_files = self.file_manager.get_recent_files("output", 5)
 
-        for filename in recent_files:
+        for row, filename in enumerate(recent_files):
             # Create list item
             item = QListWidgetItem(filename)
 
-            # Load image as thumbnail
+            # Load image as thumbnail, using the on-disk cache when fresh
             full_path = os.path.join(self.file_manager.base_path, filename)
+            thumb_path = self.file_manager.get_thumbnail_path(filename)
             try:
-                pixmap = QPixmap(full_path)
-                if not pixmap.isNull():
-                    # Scale pixmap to thumbnail size while maintaining aspect ratio
-                    thumbnail = pixmap.scaled(
-                        60, 45, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                    item.setIcon(QIcon(thumbnail))
+                if os.path.exists(thumb_path) and os.path.getmtime(
+                    thumb_path
+                ) >= os.path.getmtime(full_path):
+                    # Cached thumbnail is up to date - decode the tiny PNG
+                    # instead of the full-resolution capture
+                    thumbnail = QPixmap(thumb_path)
+                    if not thumbnail.isNull():
+                        item.setIcon(QIcon(thumbnail))
+                    else:
+                        logger.error("Failed to load thumbnail for: %s", filename)
                 else:
-                    print(f"Failed to load thumbnail for: {filename}")
+                    # Generate the thumbnail off the GUI thread; the icon is
+                    # filled in by _on_thumbnail_ready when the job completes
+                    item.setIcon(self._placeholder_icon)
+                    job = ThumbnailJob(
+                        full_path,
+                        thumb_path,
+                        self._refresh_generation,
+                        row,
+                        self._thumb_signals,
+                    )
+                    QThreadPool.globalInstance().start(job)
             except Exception as e:
-                print(f"Error loading thumbnail for {filename}: {e}")
+                logger.error("Error loading thumbnail for %s: %s", filename, e)
 
             self.snapshot_list.addItem(item)
 
+    def seed_thumbnail_from_pixmap(self, filename, pixmap):
+        """Cache a thumbnail from an already-decoded pixmap.
+
+        Lets the post-capture refresh hit the on-disk cache instead of
+        decoding the just-written JPEG a second time.
+        """
+        if pixmap is None or pixmap.isNull():
+            return
+        thumbnail = pixmap.scaled(60, 45, Qt.KeepAspectRatio, Qt.FastTransformation)
+        thumbnail.save(self.file_manager.get_thumbnail_path(filename), "PNG")
+
+    def _on_thumbnail_ready(self, generation, row, image):
+        """Apply a worker-generated thumbnail to its list item (GUI thread)."""
+        if generation != self._refresh_generation:
+            return  # Stale result from a superseded refresh
+        item = self.snapshot_list.item(row)
+        if item:
+            item.setIcon(QIcon(QPixmap.fromImage(image)))
+
 
 class CameraApp(QWidget):
     """Main camera application window."""
 
-    # Application states
-    STATE_AF = 0
-    STATE_CAPTURE = 1
+    # Emitted from the encode worker once a capture is on disk
+    capture_saved = pyqtSignal(str)
 
-    def __init__(self):
+    # Emitted from the camera thread when the capture sequence is done and
+    # the GUI controls can be re-enabled
+    controls_ready = pyqtSignal()
+
+    def __init__(self, speech_recognition=None):
         super().__init__()
-        self.state = self.STATE_AF
         self.picam2 = None
         self.preview_popup = None
         self.file_manager = FileManager()
+        self.speech_recognition = speech_recognition
         self.speech_widget = None
         self.snapshot_widget = None
+        self._last_capture_filename = None
+        self._encode_q = None
+        self._encode_thread = None
+        self._still_warmed = False
+
+        # Resolved once; reused by the (lazily built) preview popup so
+        # reconstruction never re-walks the palette
+        c = self.palette().color(QPalette.Window)
+        self._bg_colour = (c.red(), c.green(), c.blue())
 
         self._init_camera()
+        # Controls are constructed exactly once, before the layouts that
+        # arrange them; re-running _init_ui must never re-create widgets
+        self._create_camera_controls()
         self._init_ui()
 
+        self.capture_saved.connect(
+            self._on_capture_saved, type=QtCore.Qt.QueuedConnection
+        )
+        self.controls_ready.connect(
+            self._on_controls_ready, type=QtCore.Qt.QueuedConnection
+        )
+
     def _init_camera(self):
         """Initialize the camera with configuration."""
         self.picam2 = Picamera2()
 
+        # Keep DMA buffers alive across preview<->still mode switches;
+        # re-allocating from the CMA heap on every capture fragments it and
+        # eventually fails with ENOMEM on long sessions
+        try:
+            from picamera2.allocators import PersistentAllocator
+
+            self.picam2.allocator = PersistentAllocator()
+        except ImportError:
+            # Older picamera2 releases fall back to per-switch allocation
+            pass
+
         # Check autofocus support
         if "AfMode" not in self.picam2.camera_controls:
             raise RuntimeError("Attached camera does not support autofocus")
 
         # Configure camera
         config = CameraConfig.get_preview_config(self.picam2)
+        self._preview_cfg = config
         self.picam2.configure(config)
         self.picam2.set_controls({"AfMode": controls.AfModeEnum.Continuous})
+        self._af_mode = controls.AfModeEnum.Continuous
+
+        # Build the still configuration once; re-running mode selection and
+        # buffer allocation on every shutter press costs tens of ms. One
+        # buffer and no display stream keeps the allocation small.
+        # Pinning the raw stream and sensor geometry to the native full-res
+        # mode also spares libcamera its scoring pass over every raw mode
+        # on each reconfigure
+        still_mode = max(
+            self.picam2.sensor_modes, key=lambda m: m["size"][0] * m["size"][1]
+        )
+        self._still_cfg = self.picam2.create_still_configuration(
+            # 24bpp main stream: a quarter less bandwidth and CMA than the
+            # 32bpp default, and the still mode never feeds the GL preview
+            main={"format": "BGR888"},
+            raw={"size": still_mode["size"], "format": str(still_mode["format"])},
+            sensor={
+                "output_size": still_mode["size"],
+                "bit_depth": still_mode["bit_depth"],
+            },
+            buffer_count=1,
+            display=None,
+            queue=False,
+        )
+
+        # Saving happens on a dedicated worker so the Qt event loop never
+        # waits on JPEG encode or SD-card I/O
+        self._encode_q = queue.Queue(maxsize=4)
+        self._encode_thread = threading.Thread(target=self._encode_worker, daemon=True)
+        self._encode_thread.start()
 
     def _init_ui(self):
         """Initialize the user interface."""
+        assert not hasattr(self, "_ui_built"), "UI must only be built once"
+        self._ui_built = True
+
         self.setWindowTitle("Camera & Speech Recognition App")
 
-        # Create camera preview popup
-        self.preview_popup = CameraPreviewPopup(self.picam2, self)
-        self.preview_popup.qpicamera2.done_signal.connect(
-            self._camera_callback, type=QtCore.Qt.QueuedConnection
+        # Capture completions flow through our own signal object; the
+        # preview popup (and its GL context) is only built on first use
+        # Each capture phase gets its own completion handler, selected at
+        # submit time - no shared state flag to keep in sync. Direct
+        # connections run the AF->capture handoff right on the camera
+        # thread without an event-loop round-trip; everything that touches
+        # widgets is re-queued via controls_ready/capture_saved
+        self._af_signal = CaptureSignal()
+        self._af_signal.done_signal.connect(
+            self._on_af_done, type=QtCore.Qt.DirectConnection
         )
+        self._capture_signal = CaptureSignal()
+        self._capture_signal.done_signal.connect(
+            self._on_capture_done, type=QtCore.Qt.DirectConnection
+        )
+        # Bound references used on every capture; skips the per-call
+        # attribute chain
+        self._af_done = self._af_signal.signal_done
+        self._capture_done = self._capture_signal.signal_done
+        self._wait = self.picam2.wait
 
         # Create main vertical layout
         main_layout = QVBoxLayout()
 
         # Create speech recognition widget (top section)
-        self.speech_widget = SpeechRecognitionWidget()
+        self.speech_widget = SpeechRecognitionWidget(self.speech_recognition)
         self.speech_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         main_layout.addWidget(self.speech_widget, 1)  # Takes most space
 
         # Add separator
-        separator = QFrame()
-        separator.setFrameShape(QFrame.HLine)
-        separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet("QFrame { color: #ccc; }")
-        main_layout.addWidget(separator)
+        main_layout.addWidget(_make_separator(QFrame.HLine))
 
         # Create camera controls panel (bottom section)
         camera_panel = self._create_camera_controls_panel()
@@ -208,12 +443,9 @@ class CameraApp(QWidget):
         """Create the camera controls panel widget."""
         camera_widget = QWidget()
 
-        # Create snapshot list widget first
+        # Create snapshot list widget (controls already exist from __init__)
         self.snapshot_widget = SnapshotListWidget(self.file_manager)
 
-        # Create camera controls (now that snapshot_widget exists)
-        self._create_camera_controls()
-
         # Connect snapshot selection to copy button state
         self.snapshot_widget.snapshot_list.itemSelectionChanged.connect(
             self._on_snapshot_selection_changed
@@ -227,11 +459,7 @@ class CameraApp(QWidget):
         main_camera_layout.addWidget(self.snapshot_widget, 0)  # Fixed size
 
         # Add vertical separator
-        separator = QFrame()
-        separator.setFrameShape(QFrame.VLine)
-        separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet("QFrame { color: #ccc; }")
-        main_camera_layout.addWidget(separator)
+        main_camera_layout.addWidget(_make_separator(QFrame.VLine))
 
         # Right side - Camera controls
         camera_controls_widget = QWidget()
@@ -278,84 +506,187 @@ class CameraApp(QWidget):
         self.continuous_checkbox = QCheckBox("Continuous AF", checked=True)
         self.continuous_checkbox.toggled.connect(self._on_continuous_toggled)
 
+        # Debounce checkbox bounces so only the final AF mode reaches
+        # libcamera instead of one IPC per toggle
+        self._pending_af_mode = None
+        self._af_debounce = QTimer(self)
+        self._af_debounce.setSingleShot(True)
+        self._af_debounce.setInterval(50)
+        self._af_debounce.timeout.connect(self._apply_pending_af_mode)
+
     def _on_preview_toggle(self, checked):
         """Handle preview toggle button."""
         if checked:
+            if self.preview_popup is None:
+                # Deferred to first use: the GL preview costs an EGL
+                # context, shaders and framebuffers that never pay off
+                # if the preview stays closed
+                self.preview_popup = CameraPreviewPopup(
+                    self.picam2, self, bg_colour=self._bg_colour
+                )
             self.preview_popup.show()
             self.preview_button.setText("Hide Preview")
         else:
-            self.preview_popup.hide()
+            if self.preview_popup:
+                self.preview_popup.hide()
             self.preview_button.setText("Show Preview")
 
     def _on_capture_clicked(self):
         """Handle capture button click."""
         self._set_controls_enabled(False)
 
-        self.state = (
-            self.STATE_AF if self.af_checkbox.isChecked() else self.STATE_CAPTURE
+        # A dedicated AF cycle buys nothing when continuous AF is actually
+        # running - skip straight to the capture in that case. Gate on the
+        # applied mode rather than the checkbox: the post-capture reset
+        # drops the camera back to Auto, so the checkbox alone would skip
+        # AF on every shot after the first and leave focus stale
+        do_af = (
+            self.af_checkbox.isChecked()
+            and self._af_mode != controls.AfModeEnum.Continuous
         )
 
-        if self.state == self.STATE_AF:
-            self.picam2.autofocus_cycle(
-                signal_function=self.preview_popup.qpicamera2.signal_done
-            )
+        if do_af:
+            self.picam2.autofocus_cycle(signal_function=self._af_done)
         else:
             self._do_capture()
 
     def _do_capture(self):
         """Perform image capture."""
-        cfg = self.picam2.create_still_configuration()
         filename = self.file_manager.get_next_filename("output")
-        self.picam2.switch_mode_and_capture_file(
-            cfg, filename, signal_function=self.preview_popup.qpicamera2.signal_done
+        self._last_capture_filename = filename
+        # Capture a request rather than a file so the completed buffer is
+        # handed back to the preallocated pool after saving
+        self.picam2.switch_mode_and_capture_request(
+            self._still_cfg,
+            signal_function=self._capture_done,
         )
 
-    def _camera_callback(self, job):
-        """Handle camera operation completion."""
-        if self.state == self.STATE_AF:
-            self.state = self.STATE_CAPTURE
-            success = "succeeded" if self.picam2.wait(job) else "failed"
-            print(f"AF cycle {success} in {job.calls} frames")
-            self._do_capture()
+    def _on_af_done(self, job):
+        """Continue to the capture once the AF cycle completes (camera
+        thread)."""
+        success = "succeeded" if self._wait(job) else "failed"
+        # Lazy formatting, and the actual I/O runs on the log listener
+        # thread rather than in this callback
+        logger.info("AF cycle %s in %s frames", success, job.calls)
+        self._do_capture()
+
+    def _on_capture_done(self, job):
+        """Queue the completed capture for saving (camera thread).
+
+        Must not touch widgets; GUI updates go through the queued
+        controls_ready and capture_saved signals.
+        """
+        request = self._wait(job)
+
+        # Hand the completed request to the encode worker; the GUI
+        # thread only does a queue put
+        if self._last_capture_filename:
+            try:
+                self._encode_q.put_nowait((request, self._last_capture_filename))
+            except queue.Full:
+                # Controls are disabled during capture so this should
+                # not happen; drop rather than stall the GUI thread
+                request.release()
+                logger.warning(
+                    "Encode queue full, dropping capture: %s",
+                    self._last_capture_filename,
+                )
         else:
-            self.picam2.wait(job)
-
-            # Show capture result
-            latest_file = self.file_manager.get_latest_filename("output")
-            if latest_file:
-                print(f"Captured: {latest_file}")
-                # Automatically copy the captured image to clipboard
-                self._copy_image_to_clipboard(latest_file)
-
-            # Refresh snapshot list
-            if self.snapshot_widget:
-                self.snapshot_widget.refresh_snapshots()
-
-            # Reset camera and UI
-            self.picam2.set_controls({"AfMode": controls.AfModeEnum.Auto})
-            self._set_controls_enabled(True)
+            request.release()
+
+        # Reset camera and UI immediately; saving continues in the
+        # background and _on_capture_saved finishes the bookkeeping
+        self._set_af_mode(controls.AfModeEnum.Auto)
+        self.controls_ready.emit()
+
+    def _on_controls_ready(self):
+        """Re-enable controls on the GUI thread after a capture."""
+        self._set_controls_enabled(True)
+
+    def _encode_worker(self):
+        """Save completed capture requests off the GUI thread."""
+        while True:
+            item = self._encode_q.get()
+            if item is None:
+                break
+            request, filename = item
+            try:
+                request.save("main", filename)
+                saved = True
+            except Exception as e:
+                logger.error("Error saving capture %s: %s", filename, e)
+                saved = False
+            finally:
+                # Stale requests pin buffers; always hand them back
+                request.release()
+            if saved:
+                self.capture_saved.emit(os.path.basename(filename))
+
+    def _on_capture_saved(self, latest_file):
+        """Finish capture bookkeeping on the GUI thread once saved."""
+        self.file_manager.register_captured(latest_file)
+        logger.info("Captured: %s", latest_file)
+
+        # Automatically copy the captured image to clipboard, and reuse the
+        # decoded pixmap to seed the thumbnail cache so the refresh below
+        # skips a second JPEG decode
+        pixmap = self._copy_image_to_clipboard(latest_file)
+        if self.snapshot_widget and pixmap is not None:
+            self.snapshot_widget.seed_thumbnail_from_pixmap(latest_file, pixmap)
+
+        # Refresh snapshot list
+        if self.snapshot_widget:
+            self.snapshot_widget.refresh_snapshots()
 
     def _copy_image_to_clipboard(self, filename):
-        """Copy the specified image file to clipboard."""
+        """Copy the specified image file to clipboard.
+
+        Returns the decoded QPixmap so callers can reuse it, or None.
+        """
         if not filename:
-            return
+            return None
 
         image_path = os.path.join(self.file_manager.base_path, filename)
         try:
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                clipboard = QApplication.clipboard()
-                clipboard.setPixmap(pixmap)
-                print(f"Auto-copied image to clipboard: {filename}")
-            else:
-                print(f"Failed to load captured image: {image_path}")
+            # Reuse the decoded pixmap when the same capture is copied again
+            # (e.g. the post-capture auto-copy followed by a manual copy)
+            key = f"{image_path}:{os.path.getmtime(image_path)}"
+            pixmap = QPixmap()
+            if not QPixmapCache.find(key, pixmap):
+                pixmap = QPixmap(image_path)
+                if pixmap.isNull():
+                    logger.error("Failed to load captured image: %s", image_path)
+                    return None
+                QPixmapCache.insert(key, pixmap)
+            clipboard = QApplication.clipboard()
+            clipboard.setPixmap(pixmap)
+            logger.info("Auto-copied image to clipboard: %s", filename)
+            return pixmap
         except Exception as e:
-            print(f"Error auto-copying image: {e}")
+            logger.error("Error auto-copying image: %s", e)
+            return None
+
+    def _set_af_mode(self, mode):
+        """Apply an AF mode only when it differs from the last one set.
+
+        Each set_controls call is an IPC round-trip into libcamera, so
+        no-op changes are skipped.
+        """
+        if mode != self._af_mode:
+            self.picam2.set_controls({"AfMode": mode})
+            self._af_mode = mode
 
     def _on_continuous_toggled(self, checked):
         """Handle continuous autofocus toggle."""
         mode = controls.AfModeEnum.Continuous if checked else controls.AfModeEnum.Auto
-        self.picam2.set_controls({"AfMode": mode})
+        self._pending_af_mode = mode
+        self._af_debounce.start()
+
+    def _apply_pending_af_mode(self):
+        """Apply the last AF mode requested within the debounce window."""
+        if self._pending_af_mode is not None:
+            self._set_af_mode(self._pending_af_mode)
+            self._pending_af_mode = None
 
     def _set_controls_enabled(self, enabled):
         """Enable or disable UI controls."""
@@ -378,13 +709,39 @@ class CameraApp(QWidget):
         """Show the window and start camera."""
         self.picam2.start()
         super().show()
+        # Pay the expensive first preview->still reconfigure while the
+        # window is coming up, not on the user's first shot
+        QTimer.singleShot(0, self._warm_still_mode)
+
+    def _warm_still_mode(self):
+        """Round-trip through the still mode once at startup.
+
+        The first switch_mode after start takes hundreds of ms while
+        subsequent ones take tens; warming here leaves only the cheap
+        steady-state cost on the first capture.
+        """
+        if self._still_warmed:
+            return
+        self._still_warmed = True
+        self._set_controls_enabled(False)
+        try:
+            self.picam2.switch_mode(self._still_cfg)
+            self.picam2.switch_mode(self._preview_cfg)
+        finally:
+            self._set_controls_enabled(True)
 
     def closeEvent(self, event):
         """Handle window close event."""
+        # Flush the encode worker before the camera (and its buffers) go
+        if self._encode_thread:
+            self._encode_q.put(None)
+            self._encode_thread.join(timeout=2)
         if self.picam2:
             self.picam2.stop()
+            # Releases the persistent buffer pool along with the camera
+            self.picam2.close()
         if self.preview_popup:
-            self.preview_popup.close()
+            self.preview_popup.force_close()
         if self.speech_widget:
             self.speech_widget.closeEvent(event)
         event.accept()
@@ -2,6 +2,20 @@
 Camera Configuration Settings
 """
 
+import functools
+
+
+@functools.lru_cache(maxsize=4)
+def _compute_sizes(sensor_width, sensor_height, pixel_width, pixel_height):
+    """Compute preview and raw stream sizes, cached per sensor geometry."""
+    preview_height = sensor_height * CameraConfig.PREVIEW_WIDTH // sensor_width
+    preview_height -= preview_height % 2
+    preview_size = (CameraConfig.PREVIEW_WIDTH, preview_height)
+
+    # Full FoV raw mode (2x2 binned)
+    raw_size = (pixel_width // 2, pixel_height // 2)
+    return preview_size, raw_size
+
 
 class CameraConfig:
     """Camera configuration utilities."""
@@ -11,22 +25,21 @@ class CameraConfig:
     @classmethod
     def get_preview_size(cls, picam2):
         """Calculate preview size based on sensor aspect ratio."""
-        preview_height = (
-            picam2.sensor_resolution[1]
-            * cls.PREVIEW_WIDTH
-            // picam2.sensor_resolution[0]
+        sensor_width, sensor_height = picam2.sensor_resolution
+        pixel_width, pixel_height = picam2.camera_properties["PixelArraySize"]
+        preview_size, _ = _compute_sizes(
+            sensor_width, sensor_height, pixel_width, pixel_height
         )
-        preview_height -= preview_height % 2
-        return cls.PREVIEW_WIDTH, preview_height
+        return preview_size
 
     @classmethod
     def get_preview_config(cls, picam2):
         """Create preview configuration for the camera."""
-        preview_width, preview_height = cls.get_preview_size(picam2)
-        preview_size = (preview_width, preview_height)
-
-        # Full FoV raw mode (2x2 binned)
-        raw_size = tuple([v // 2 for v in picam2.camera_properties["PixelArraySize"]])
+        sensor_width, sensor_height = picam2.sensor_resolution
+        pixel_width, pixel_height = picam2.camera_properties["PixelArraySize"]
+        preview_size, raw_size = _compute_sizes(
+            sensor_width, sensor_height, pixel_width, pixel_height
+        )
 
         return picam2.create_preview_configuration(
             {"size": preview_size}, raw={"size": raw_size}
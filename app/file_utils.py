@@ -3,7 +3,8 @@ File Management Utilities
 """
 
 import os
-import glob
+import itertools
+from collections import deque
 
 
 class FileManager:
@@ -21,45 +22,72 @@ class FileManager:
             # Define the images directory
             self.base_path = os.path.join(project_root, "images")
 
-        # Ensure the images directory exists
-        if not os.path.exists(self.base_path):
-            os.makedirs(self.base_path)
+        # Ensure the images and thumbnail cache directories exist; exist_ok
+        # avoids the separate stat and its check-then-create race
+        os.makedirs(self.base_path, exist_ok=True)
+        self.thumbs_path = os.path.join(self.base_path, ".thumbs")
+        os.makedirs(self.thumbs_path, exist_ok=True)
+
+        # One-off scan seeds the filename counter and the recent-files cache
+        # so the per-capture paths never glob or stat the directory again.
+        # The cache holds bare filenames: consumers never need mtimes, so
+        # there is no reason to carry (name, mtime) pairs around
+        self._next_num = 1
+        self._recent = deque(maxlen=32)
+        self._scan_existing("output")
+
+    def _scan_existing(self, base_name="output"):
+        """Scan the images directory once to seed the counter and cache."""
+        # A single scandir pass replaces glob's listdir + fnmatch filter;
+        # the number parse doubles as the pattern match
+        prefix = f"{base_name}_"
+        numbered = []
+        with os.scandir(self.base_path) as it:
+            for entry in it:
+                filename = entry.name
+                if not (filename.startswith(prefix) and filename.endswith(".jpg")):
+                    continue
+                try:
+                    num = int(filename[len(prefix) : -4])
+                except ValueError:
+                    continue
+                numbered.append((num, filename))
+
+        # Numeric order matches creation order for this naming scheme, so
+        # no mtime stat calls are needed
+        numbered.sort(reverse=True)
+        self._next_num = numbered[0][0] + 1 if numbered else 1
+        # Truncate to capacity before extending: a full deque evicts from
+        # the left, which would throw away the newest files seeded first
+        self._recent.extend(
+            filename for _, filename in numbered[: self._recent.maxlen]
+        )
+
+    def get_thumbnail_path(self, filename):
+        """Get the path of the cached thumbnail for the given image filename."""
+        return os.path.join(self.thumbs_path, f"{filename}.png")
 
     def get_next_filename(self, base_name="output"):
-        """Find the next available filename by checking existing files."""
-        pattern = os.path.join(self.base_path, f"{base_name}_*.jpg")
-        existing_files = glob.glob(pattern)
+        """Get the next available filename from the cached counter."""
+        path = os.path.join(self.base_path, f"{base_name}_{self._next_num}.jpg")
+
+        # Cheap collision check in case files were dropped into the
+        # directory behind the counter's back since the startup scan
+        while os.path.exists(path):
+            self._next_num += 1
+            path = os.path.join(self.base_path, f"{base_name}_{self._next_num}.jpg")
 
-        # Extract numbers from existing filenames
-        numbers = []
-        for file in existing_files:
-            filename = os.path.basename(file)
-            try:
-                num = int(filename.split("_")[1].split(".")[0])
-                numbers.append(num)
-            except (IndexError, ValueError):
-                continue
+        self._next_num += 1
+        return path
 
-        # Start with 1, or increment from highest existing number
-        next_num = 1 if not numbers else max(numbers) + 1
-        return os.path.join(self.base_path, f"{base_name}_{next_num}.jpg")
+    def register_captured(self, path):
+        """Record a newly captured file at the front of the recent cache."""
+        self._recent.appendleft(os.path.basename(path))
 
     def get_latest_filename(self, base_name="output"):
-        """Get the most recently created file with the given base name."""
-        pattern = os.path.join(self.base_path, f"{base_name}_*.jpg")
-        files = glob.glob(pattern)
-        if not files:
-            return None
-        # Sort by modification time (most recent first)
-        files.sort(key=os.path.getmtime, reverse=True)
-        return os.path.basename(files[0])
+        """Get the most recently captured file with the given base name."""
+        return self._recent[0] if self._recent else None
 
     def get_recent_files(self, base_name="output", count=5):
         """Get the most recent files with the given base name."""
-        pattern = os.path.join(self.base_path, f"{base_name}_*.jpg")
-        files = glob.glob(pattern)
-        if not files:
-            return []
-        # Sort by modification time (most recent first)
-        files.sort(key=os.path.getmtime, reverse=True)
-        return [os.path.basename(f) for f in files[:count]]
+        return list(itertools.islice(self._recent, count))
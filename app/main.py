@@ -3,26 +3,90 @@
 Camera Application Entry Point
 """
 
+import logging
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QPixmapCache
+
+logger = logging.getLogger("main")
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the rendered time within the same second.
+
+    strftime only runs when the second changes, so bursts of records
+    share one formatted timestamp. Only safe because the listener thread
+    is the sole caller.
+    """
+
+    def __init__(self, fmt):
+        super().__init__(fmt)
+        self._last_sec = None
+        self._last_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_time = time.strftime("%H:%M:%S", time.localtime(sec))
+        return self._last_time
 
-from camera_app import CameraApp
+
+def _setup_logging():
+    """Route log records through a queue to a background listener.
+
+    Emitting threads (including the Qt GUI thread and the capture
+    callback) only enqueue records; the stream I/O happens on the
+    listener's own thread.
+    """
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        CachedTimeFormatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    return listener
 
 
 def main():
     """Main entry point for the camera application."""
+    listener = _setup_logging()
     app = QApplication(sys.argv)
 
+    # Room for a few full-resolution captures in Qt's pixmap cache (KB)
+    QPixmapCache.setCacheLimit(65536)
+
+    # Deferred imports: camera_app pulls in picamera2/libcamera and
+    # speech_recognition pulls in the Google client - several hundred ms
+    # that would otherwise run before the window can even start building
+    from camera_app import CameraApp
+    from speech_recognition import SpeechRecognition
+
+    # Kick off the speech warm-up now so it overlaps widget construction
+    # instead of starting after the window is built
+    speech_recognition = SpeechRecognition()
+    speech_recognition.warm_up()
+
     try:
-        camera_app = CameraApp()
+        camera_app = CameraApp(speech_recognition)
         camera_app.show()
         return app.exec()
-    except Exception as e:
-        print(f"Error starting camera application: {e}")
+    except Exception:
+        # Lazy formatting plus the traceback for free
+        logger.exception("Error starting camera application")
         return 1
     finally:
-        # Cleanup is handled in CameraApp destructor
-        pass
+        # Cleanup is handled in CameraApp destructor; flush pending logs
+        listener.stop()
 
 
 if __name__ == "__main__":
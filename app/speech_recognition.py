@@ -1,16 +1,36 @@
-import queue
+import logging
 import re
 import os
 import threading
+import time
+from collections import deque
 
+import grpc
+from google.api_core.client_options import ClientOptions
 from google.cloud import speech
 import pyaudio
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+logger = logging.getLogger(__name__)
 
 # Audio recording parameters
 RATE = 16000
 CHUNK = int(RATE / 10)  # 100ms
 
+# Spoken commands that stop the recognition loop
+EXIT_RE = re.compile(r"\b(?:exit|quit)\b", re.IGNORECASE)
+
+# Minimum spacing between interim transcript emissions
+EMIT_INTERVAL_NS = 80_000_000  # 80ms
+
+# Cap on buffered microphone chunks (~5 seconds of audio)
+BUFFER_MAX_CHUNKS = 50
+
+# Target audio span per streaming request; larger chunks mean fewer
+# protobuf encodes and HTTP/2 frames at a small recognition-latency cost
+STREAM_CHUNK_MS = 250
+STREAM_CHUNK_BYTES = RATE * 2 * STREAM_CHUNK_MS // 1000
+
 
 class MicrophoneStream:
     """Opens a recording stream as a generator yielding the audio chunks."""
@@ -18,10 +38,17 @@ class MicrophoneStream:
     def __init__(self, rate: int = RATE, chunk: int = CHUNK) -> None:
         self._rate = rate
         self._chunk = chunk
-        self._buff = queue.Queue()
+        # deque appends are atomic under the GIL, so the portaudio callback
+        # never waits on a queue mutex; the bounded maxlen drops the oldest
+        # chunk on overflow (freshness beats completeness for live speech,
+        # and a stalled gRPC consumer cannot grow the buffer without limit)
+        self._buff = deque(maxlen=BUFFER_MAX_CHUNKS)
+        self._data_ready = threading.Event()
         self.closed = True
 
     def __enter__(self):
+        # Reusable accumulation buffer for ticks that drain several chunks
+        self._scratch = bytearray(self._chunk * 2 * 8)
         self._audio_interface = pyaudio.PyAudio()
         self._audio_stream = self._audio_interface.open(
             format=pyaudio.paInt16,
@@ -38,30 +65,89 @@ class MicrophoneStream:
         self._audio_stream.stop_stream()
         self._audio_stream.close()
         self.closed = True
-        self._buff.put(None)
+        # Wake the generator so it can flush what's left and terminate
+        self._data_ready.set()
         self._audio_interface.terminate()
 
     def _fill_buffer(self, in_data, frame_count, time_info, status_flags):
-        self._buff.put(in_data)
+        self._buff.append(in_data)
+        self._data_ready.set()
         return None, pyaudio.paContinue
 
     def generator(self):
-        while not self.closed:
-            chunk = self._buff.get()
-            if chunk is None:
-                return
-            data = [chunk]
+        off = 0
+        while True:
+            self._data_ready.wait()
+            self._data_ready.clear()
+
+            # Snapshot before draining so audio buffered ahead of the
+            # close still gets flushed on the final pass
+            closing = self.closed
 
+            # Drain whatever is buffered straight into the reusable scratch
+            # buffer - no per-tick list or join allocation
             while True:
                 try:
-                    chunk = self._buff.get(block=False)
-                    if chunk is None:
-                        return
-                    data.append(chunk)
-                except queue.Empty:
+                    chunk = self._buff.popleft()
+                except IndexError:
                     break
+                off = self._copy_to_scratch(off, chunk)
+
+            # Hold the accumulated audio until a full stream chunk is
+            # ready (or the stream is closing), so each yield becomes one
+            # StreamingRecognizeRequest
+            if off and (off >= STREAM_CHUNK_BYTES or closing):
+                yield bytes(memoryview(self._scratch)[:off])
+                off = 0
+
+            if closing:
+                return
 
-            yield b"".join(data)
+    def _copy_to_scratch(self, off, chunk):
+        """Append a chunk to the scratch buffer, growing it if needed."""
+        end = off + len(chunk)
+        if end > len(self._scratch):
+            self._scratch.extend(bytearray(end - len(self._scratch)))
+        self._scratch[off:end] = chunk
+        return end
+
+
+# One SpeechClient (and its gRPC channel) per process: stop/start cycles
+# and any additional recognizer instances reuse the warm TLS/HTTP2
+# connection instead of re-handshaking
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def _get_shared_client():
+    """Return the process-wide SpeechClient, created on first use."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            # Set credentials path relative to project root
+            credentials_path = os.path.join(
+                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                "service-account-key.json",
+            )
+            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
+            _shared_client = speech.SpeechClient(
+                transport="grpc",
+                client_options=ClientOptions(
+                    api_endpoint="speech.googleapis.com:443"
+                ),
+            )
+        return _shared_client
+
+
+class WarmupJob(QRunnable):
+    """Run the speech recognition pre-warm off the GUI thread."""
+
+    def __init__(self, speech_recognition):
+        super().__init__()
+        self._speech_recognition = speech_recognition
+
+    def run(self):
+        self._speech_recognition._prepare_recognition()
 
 
 class SpeechRecognition(QObject):
@@ -80,18 +166,26 @@ class SpeechRecognition(QObject):
         self.client = None
         self.recognition_thread = None
         self._is_initialized = False
+        self._warmup_started = False
+        self._last_emit_ns = 0
         self._setup_client()
 
+    @property
+    def is_prepared(self):
+        """Whether the pre-warm has completed."""
+        return self._is_initialized
+
+    def warm_up(self):
+        """Start the pre-warm on the shared thread pool, at most once."""
+        if self._warmup_started or self._is_initialized:
+            return
+        self._warmup_started = True
+        QThreadPool.globalInstance().start(WarmupJob(self))
+
     def _setup_client(self):
         """Initialize Google Speech client."""
         try:
-            # Set credentials path relative to project root
-            credentials_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                "service-account-key.json",
-            )
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
-            self.client = speech.SpeechClient()
+            self.client = _get_shared_client()
         except Exception as e:
             self.error_occurred.emit(f"Failed to initialize speech client: {e}")
 
@@ -115,6 +209,14 @@ class SpeechRecognition(QObject):
 
     def _recognition_loop(self):
         """Main recognition loop running in separate thread."""
+        # Best-effort real-time priority so audio streaming stays ahead of
+        # GUI repaints; needs CAP_SYS_NICE, so refusal is expected and
+        # harmless on most setups (and the call does not exist everywhere)
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(5))
+        except (AttributeError, PermissionError, OSError):
+            logger.debug("Real-time scheduling unavailable for recognition")
+
         try:
             language_code = "en-US"
             config = speech.RecognitionConfig(
@@ -160,9 +262,14 @@ class SpeechRecognition(QObject):
             transcript = result.alternatives[0].transcript
             is_final = result.is_final
 
-            self.transcript_updated.emit(transcript, is_final)
+            # Interim results arrive faster than the UI can usefully repaint;
+            # coalesce them while always passing final results through
+            now = time.monotonic_ns()
+            if is_final or (now - self._last_emit_ns) > EMIT_INTERVAL_NS:
+                self.transcript_updated.emit(transcript, is_final)
+                self._last_emit_ns = now
 
-            if is_final and re.search(r"\b(exit|quit)\b", transcript, re.I):
+            if is_final and EXIT_RE.search(transcript):
                 self.stop_recording()
                 break
 
@@ -178,7 +285,9 @@ class SpeechRecognition(QObject):
             # Test microphone access and get default input device info
             default_device = audio_interface.get_default_input_device_info()
 
-            # Brief initialization of audio stream to warm up the audio system
+            # Brief initialization of audio stream to warm up the audio
+            # system; opening the stream is enough to stage the portaudio
+            # buffers - no blocking read needed
             test_stream = audio_interface.open(
                 format=pyaudio.paInt16,
                 channels=1,
@@ -187,9 +296,6 @@ class SpeechRecognition(QObject):
                 frames_per_buffer=CHUNK,
             )
 
-            # Read a small amount of audio data to fully initialize
-            test_stream.read(CHUNK, exception_on_overflow=False)
-
             # Clean up test objects
             test_stream.stop_stream()
             test_stream.close()
@@ -202,9 +308,19 @@ class SpeechRecognition(QObject):
                 language_code="en-US",
             )
 
+            # Pre-establish the gRPC channel (TLS handshake and HTTP/2
+            # setup) so the first streaming_recognize call starts warm;
+            # best-effort - an offline start shouldn't block initialization
+            try:
+                grpc.channel_ready_future(
+                    self.client.transport.grpc_channel
+                ).result(timeout=5)
+            except Exception as e:
+                logger.warning("Could not pre-connect speech channel: %s", e)
+
             self._is_initialized = True
             self.initialization_complete.emit()
 
         except Exception as e:
-            print(f"Warning: Could not pre-warm speech recognition: {e}")
+            logger.warning("Could not pre-warm speech recognition: %s", e)
             # Don't emit error signal as this is just optimization
@@ -1,14 +1,16 @@
+from collections import deque
+
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QTextEdit,
+    QPlainTextEdit,
     QLabel,
     QApplication,
     QSizePolicy,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThreadPool, QTimer
 
 from speech_recognition import SpeechRecognition
 
@@ -16,12 +18,23 @@ from speech_recognition import SpeechRecognition
 class SpeechRecognitionWidget(QWidget):
     """Widget for speech recognition functionality."""
 
-    def __init__(self):
+    def __init__(self, speech_recognition=None):
         super().__init__()
-        self.speech_recognition = SpeechRecognition()
+        # A pre-warmed instance can be handed in from app startup
+        self.speech_recognition = speech_recognition or SpeechRecognition()
+        self._clipboard = QApplication.clipboard()
         self.current_transcript = ""
-        self.final_transcript = ""
+        self._final_segments = deque()
+        self._last_partial = ""
+        self._pending_partial = None
         self._is_first_recording = True
+
+        # Coalesce interim updates so the label repaints at most every 50ms
+        # no matter how fast hypotheses stream in
+        self._partial_timer = QTimer(self)
+        self._partial_timer.setSingleShot(True)
+        self._partial_timer.setInterval(50)
+        self._partial_timer.timeout.connect(self._flush_partial)
         self._init_ui()
         self._connect_signals()
         # Pre-warm the speech recognition system
@@ -31,16 +44,25 @@ class SpeechRecognitionWidget(QWidget):
         """Initialize the speech recognition UI."""
         layout = QVBoxLayout()
 
-        # Transcript display at the top
-        self.transcript_display = QTextEdit()
+        # Transcript display at the top. QPlainTextEdit's line-based layout
+        # handles append-only transcripts far better than QTextEdit's
+        # rich-text document, and the block cap bounds memory on long runs
+        self.transcript_display = QPlainTextEdit()
         self.transcript_display.setReadOnly(True)
         self.transcript_display.setPlaceholderText("Transcript will appear here...")
+        self.transcript_display.setMaximumBlockCount(1000)
         self.transcript_display.setMinimumHeight(100)
         self.transcript_display.setSizePolicy(
             QSizePolicy.Expanding, QSizePolicy.Expanding
         )
         layout.addWidget(self.transcript_display)
 
+        # Interim hypotheses go in their own label so partial updates never
+        # rewrite the finalized document
+        self.interim_label = QLabel("")
+        self.interim_label.setStyleSheet("color: #888; font-style: italic;")
+        layout.addWidget(self.interim_label)
+
         # Control buttons layout
         button_layout = QHBoxLayout()
 
@@ -74,30 +96,49 @@ class SpeechRecognitionWidget(QWidget):
         self.setLayout(layout)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
+    @property
+    def final_transcript(self):
+        """Full finalized transcript, joined only when actually needed."""
+        return "\n".join(self._final_segments)
+
     def _connect_signals(self):
-        """Connect speech recognition signals to UI updates."""
-        self.speech_recognition.transcript_updated.connect(self._on_transcript_updated)
-        self.speech_recognition.error_occurred.connect(self._on_error)
-        self.speech_recognition.recording_started.connect(self._on_recording_started)
-        self.speech_recognition.recording_stopped.connect(self._on_recording_stopped)
+        """Connect speech recognition signals to UI updates.
+
+        Connection types are pinned instead of letting Qt re-check sender
+        and receiver threads on every emit: signals fired from the
+        recognition/warm-up threads are queued, recording_started is only
+        ever emitted on the GUI thread so it can be direct.
+        """
+        self.speech_recognition.transcript_updated.connect(
+            self._on_transcript_updated, type=Qt.QueuedConnection
+        )
+        self.speech_recognition.error_occurred.connect(
+            self._on_error, type=Qt.QueuedConnection
+        )
+        self.speech_recognition.recording_started.connect(
+            self._on_recording_started, type=Qt.DirectConnection
+        )
+        # recording_stopped is emitted from both the GUI thread (stop) and
+        # the recognition thread (loop teardown); queued is safe for both
+        self.speech_recognition.recording_stopped.connect(
+            self._on_recording_stopped, type=Qt.QueuedConnection
+        )
         self.speech_recognition.initialization_complete.connect(
-            self._on_initialization_complete
+            self._on_initialization_complete, type=Qt.QueuedConnection
         )
 
     def _warm_up_speech_recognition(self):
         """Pre-initialize speech recognition to avoid cold start delays."""
+        if self.speech_recognition.is_prepared:
+            self._on_initialization_complete()
+            return
+
         if self._is_first_recording:
             self.status_label.setText("Initializing speech recognition...")
             self.status_label.setStyleSheet("color: orange; font-size: 12px;")
 
-            # Run preparation in a separate thread to avoid blocking UI
-            import threading
-
-            warm_up_thread = threading.Thread(
-                target=self.speech_recognition._prepare_recognition
-            )
-            warm_up_thread.daemon = True
-            warm_up_thread.start()
+            # No-op if app startup already kicked the warm-up off
+            self.speech_recognition.warm_up()
 
     def _on_initialization_complete(self):
         """Handle speech recognition initialization completion."""
@@ -110,9 +151,9 @@ class SpeechRecognitionWidget(QWidget):
         if self.speech_recognition.is_recording:
             self.speech_recognition.stop_recording()
             # Copy transcript to clipboard after stopping recording
-            if self.final_transcript.strip():
-                clipboard = QApplication.clipboard()
-                clipboard.setText(self.final_transcript.strip())
+            transcript = self.final_transcript.strip()
+            if transcript:
+                self._clipboard.setText(transcript)
                 self.status_label.setText(
                     "Recording stopped - Transcript copied to clipboard!"
                 )
@@ -129,39 +170,61 @@ class SpeechRecognitionWidget(QWidget):
 
             # Clear transcript before starting new recording
             self.transcript_display.clear()
+            self.interim_label.clear()
             self.current_transcript = ""
-            self.final_transcript = ""
+            self._final_segments.clear()
+            self._last_partial = ""
+            self._pending_partial = None
             self.speech_recognition.start_recording()
 
     def _on_copy_clicked(self):
         """Copy transcript to clipboard."""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.final_transcript)
+        self._clipboard.setText(self.final_transcript)
         self.status_label.setText("Transcript copied to clipboard!")
 
     def _on_clear_clicked(self):
         """Clear transcript display."""
         self.transcript_display.clear()
+        self.interim_label.clear()
         self.current_transcript = ""
-        self.final_transcript = ""
+        self._final_segments.clear()
+        self._last_partial = ""
+        self._pending_partial = None
         self.status_label.setText("Transcript cleared")
 
     def _on_transcript_updated(self, transcript, is_final):
         """Update transcript display."""
         if is_final:
-            self.final_transcript += transcript + "\n"
+            # Appending a segment is O(1); the joined string is only built
+            # when the transcript is copied to the clipboard
+            self._final_segments.append(transcript)
             self.current_transcript = ""
-            display_text = self.final_transcript
-        else:
-            self.current_transcript = transcript
-            display_text = self.final_transcript + f"[{transcript}]"
+            self._last_partial = ""
+            self._pending_partial = None
+            self.interim_label.clear()
 
-        self.transcript_display.setPlainText(display_text)
+            # Append just the new segment; the rest of the document is
+            # untouched
+            self.transcript_display.appendPlainText(transcript)
 
-        # Scroll to bottom
-        cursor = self.transcript_display.textCursor()
-        cursor.movePosition(cursor.End)
-        self.transcript_display.setTextCursor(cursor)
+            # Scroll to bottom
+            scrollbar = self.transcript_display.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+        else:
+            # Stash the latest hypothesis; the timer applies only the most
+            # recent one per 50ms window
+            self.current_transcript = transcript
+            self._pending_partial = transcript
+            if not self._partial_timer.isActive():
+                self._partial_timer.start()
+
+    def _flush_partial(self):
+        """Apply the latest pending interim hypothesis to the label."""
+        transcript = self._pending_partial
+        if transcript is None or transcript == self._last_partial:
+            return
+        self._last_partial = transcript
+        self.interim_label.setText(f"[{transcript}]")
 
     def _on_error(self, error_message):
         """Handle speech recognition errors."""
@@ -184,4 +247,7 @@ class SpeechRecognitionWidget(QWidget):
         """Handle widget close event."""
         if self.speech_recognition.is_recording:
             self.speech_recognition.stop_recording()
+        # Give any in-flight warm-up a moment to finish rather than dying
+        # mid-initialization with the interpreter
+        QThreadPool.globalInstance().waitForDone(1000)
         event.accept()